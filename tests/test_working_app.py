@@ -0,0 +1,79 @@
+"""
+HTTP-level regression tests for the AURA FastAPI app
+Run from the repository root with: python -m pytest -q
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+import working_app
+
+client = TestClient(working_app.app)
+
+# Mixed order on purpose: gzip rewrites response headers in place, so a response object
+# shared between requests would leak the first request's encoding into the later ones
+ENCODING_SEQUENCE = ("gzip", "gzip", "identity", "gzip", "identity")
+
+
+def test_root_survives_alternating_accept_encoding():
+    for encoding in ENCODING_SEQUENCE:
+        response = client.get("/", headers={"Accept-Encoding": encoding})
+
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == ("gzip" if encoding == "gzip" else None)
+        assert response.content == working_app._ROOT_HTML_BYTES
+
+
+def test_model_info_survives_repeated_requests():
+    etag = working_app._MODEL_INFO_HEADERS["ETag"]
+
+    for encoding in ENCODING_SEQUENCE:
+        response = client.get("/api/v2/info", headers={"Accept-Encoding": encoding})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == etag
+        assert response.json() == working_app._MODEL_INFO
+
+        not_modified = client.get("/api/v2/info", headers={"Accept-Encoding": encoding, "If-None-Match": etag})
+
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+
+@pytest.mark.parametrize("if_none_match, expected_status", [
+    ("{etag}", 304),
+    ("W/{etag}", 304),
+    ('"other", {etag}', 304),
+    ('"other",W/{etag}', 304),
+    ("*", 304),
+    ('"other"', 200),
+    ("", 200),
+])
+def test_model_info_if_none_match_uses_weak_comparison(if_none_match, expected_status):
+    etag = working_app._MODEL_INFO_HEADERS["ETag"]
+
+    response = client.get("/api/v2/info", headers={"If-None-Match": if_none_match.format(etag=etag)})
+
+    assert response.status_code == expected_status
+
+
+def test_gzip_wrapper_skips_mounted_gradio_app():
+    page = "x" * 2000
+    inner = FastAPI()
+    inner.add_api_route("/page", lambda: PlainTextResponse(page))
+    inner.add_api_route(
+        "/gradio/queue/data",
+        lambda: StreamingResponse(iter(["data: " + page + "\n\n"]), media_type="text/event-stream")
+    )
+    wrapped = TestClient(working_app._GZipExceptGradio(inner, minimum_size=500, compresslevel=5))
+
+    for encoding in ENCODING_SEQUENCE:
+        response = wrapped.get("/page", headers={"Accept-Encoding": encoding})
+        assert response.headers.get("content-encoding") == ("gzip" if encoding == "gzip" else None)
+        assert response.text == page
+
+        stream = wrapped.get("/gradio/queue/data", headers={"Accept-Encoding": encoding})
+        assert stream.headers.get("content-encoding") is None
+        assert stream.text == "data: " + page + "\n\n"
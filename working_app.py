@@ -5,136 +5,317 @@ Completely working FastAPI + Gradio integration
 """
 
 import uvicorn
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 import gradio as gr
+import hashlib
 import logging
+import os
 import pandas as pd
 import numpy as np
-from pathlib import Path
-import plotly.express as px
+import orjson
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
+
+# Production mode (AURA_ENV=prod) trims per-request logging
+IS_PRODUCTION = os.getenv("AURA_ENV") == "prod"
+
+# Browser origins allowed to call the API cross-origin (comma-separated); none by default
+CORS_ORIGINS = tuple(origin.strip() for origin in os.getenv("AURA_CORS_ORIGINS", "").split(",") if origin.strip())
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING if IS_PRODUCTION else logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Risk buckets and dashboard palette shared by the charting and prediction code
+_RISK_LABELS = ('Low Risk', 'Medium Risk', 'High Risk')
+_RISK_COLORS = ('#EBC09D', '#F88734', '#920402')  # Gold Crayola, Cadmium Orange, Blood
+_BAR_CATEGORIES = ('Total Customers', *_RISK_LABELS)
+_BAR_COLORS = ('#920402', *_RISK_COLORS)  # Blood, then the risk colors
+
 # Visualization Functions
-def create_churn_distribution_pie(prediction_data=None):
-    """Create pie chart for churn distribution"""
-    if prediction_data is None or len(prediction_data) == 0:
+def create_dashboard_figure(counts=None):
+    """Create churn distribution pie and key metrics bar as one side-by-side figure"""
+    if counts is None:
         # Default empty state - show sample data to make it visible
-        labels = ['Low Risk', 'Medium Risk', 'High Risk']
-        values = [60, 30, 10]  # Sample percentages
-        colors = ['#EBC09D', '#F88734', '#920402']  # Gold Crayola, Cadmium Orange, Blood
+        low_risk, medium_risk, high_risk = 600, 300, 100  # Sample data
     else:
-        # Count risk levels from prediction data
-        risk_counts = {'Low Risk': 0, 'Medium Risk': 0, 'High Risk': 0}
-        
-        for row in prediction_data:
-            if len(row) >= 3:  # Ensure we have at least 3 columns
-                risk_level = row[2]  # Risk Level is the 3rd column
-                if risk_level in risk_counts:
-                    risk_counts[risk_level] += 1
-        
-        labels = list(risk_counts.keys())
-        values = list(risk_counts.values())
-        colors = ['#EBC09D', '#F88734', '#920402']  # Gold Crayola, Cadmium Orange, Blood
-    
-    fig = go.Figure(data=[go.Pie(
-        labels=labels,
-        values=values,
-        hole=0.3,
-        marker_colors=colors,
-        textinfo='label+percent',
-        textfont_size=12
-    )])
+        low_risk, medium_risk, high_risk = (counts[label] for label in _RISK_LABELS)
     
-    fig.update_layout(
-        title="Churn Risk Distribution",
-        title_x=0.5,
-        font=dict(size=12),
-        showlegend=True,
-        height=400
-    )
-    
-    return fig
+    return _build_dashboard_figure(low_risk, medium_risk, high_risk)
 
-def create_key_metrics_bar(prediction_data=None):
-    """Create bar chart for key metrics"""
-    if prediction_data is None or len(prediction_data) == 0:
-        # Default empty state - show sample data to make it visible
-        categories = ['Total Customers', 'Low Risk', 'Medium Risk', 'High Risk']
-        values = [1000, 600, 300, 100]  # Sample data
-        colors = ['#920402', '#EBC09D', '#F88734', '#920402']  # Blood, Gold Crayola, Cadmium Orange, Blood
-    else:
-        # Count risk levels from prediction data
-        risk_counts = {'Low Risk': 0, 'Medium Risk': 0, 'High Risk': 0}
-        
-        for row in prediction_data:
-            if len(row) >= 3:  # Ensure we have at least 3 columns
-                risk_level = row[2]  # Risk Level is the 3rd column
-                if risk_level in risk_counts:
-                    risk_counts[risk_level] += 1
-        
-        # Calculate total customers
-        total_customers = sum(risk_counts.values())
-        
-        # Create categories and values
-        categories = ['Total Customers', 'Low Risk', 'Medium Risk', 'High Risk']
-        values = [total_customers, risk_counts['Low Risk'], risk_counts['Medium Risk'], risk_counts['High Risk']]
-        colors = ['#920402', '#EBC09D', '#F88734', '#920402']  # Blood, Gold Crayola, Cadmium Orange, Blood
+# The figure is fully determined by the three counts, so identical results reuse the built figure
+@lru_cache(maxsize=16)
+def _build_dashboard_figure(low_risk, medium_risk, high_risk):
+    """Build the dashboard figure for a given set of risk counts"""
+    risk_values = (low_risk, medium_risk, high_risk)
     
-    fig = go.Figure(data=[go.Bar(
-        x=categories,
-        y=values,
-        marker_color=colors,
-        text=values,
-        textposition='auto',
-    )])
+    # Bar values: total customers followed by each risk bucket
+    values = (sum(risk_values), *risk_values)
     
-    fig.update_layout(
-        title="Customer Risk Distribution",
-        xaxis_title="Risk Categories",
-        yaxis_title="Number of Customers",
-        title_x=0.5,
-        font=dict(size=12),
-        height=400
-    )
+    # One figure, one Plotly.js init and one payload instead of two separate plots.
+    # Built as a plain dict so Plotly validates it once instead of per trace and per update.
+    fig = go.Figure({
+        'data': [
+            {
+                'type': 'pie',
+                'labels': _RISK_LABELS,
+                'values': risk_values,
+                'hole': 0.3,
+                'marker': {'colors': _RISK_COLORS},
+                'textinfo': 'label+percent',
+                'textfont': {'size': 12},
+                'domain': {'x': [0.0, 0.45], 'y': [0.0, 1.0]}
+            },
+            {
+                'type': 'bar',
+                'x': _BAR_CATEGORIES,
+                'y': values,
+                'marker': {'color': _BAR_COLORS},
+                'text': values,
+                'textposition': 'auto',
+                'showlegend': False,
+                'xaxis': 'x',
+                'yaxis': 'y'
+            }
+        ],
+        'layout': {
+            'xaxis': {'anchor': 'y', 'domain': [0.55, 1.0], 'title': {'text': 'Risk Categories'}},
+            'yaxis': {'anchor': 'x', 'domain': [0.0, 1.0], 'title': {'text': 'Number of Customers'}},
+            'annotations': [
+                {'text': title, 'x': x, 'y': 1.0, 'xref': 'paper', 'yref': 'paper',
+                 'xanchor': 'center', 'yanchor': 'bottom', 'showarrow': False, 'font': {'size': 16}}
+                for title, x in (("Churn Risk Distribution", 0.225), ("Customer Risk Distribution", 0.775))
+            ],
+            'font': {'size': 12},
+            'showlegend': True,
+            'height': 400
+        }
+    })
     
     return fig
 
+# Built from hard-coded sample data, so the figure never changes between calls
+@lru_cache(maxsize=1)
 def create_retention_success_rate():
     """Create retention success rate prediction"""
     # Sample data - in real app, this would be calculated from model predictions
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
     success_rates = [85, 87, 89, 91, 88, 92]  # Sample retention success rates
     
-    fig = go.Figure(data=[go.Scatter(
-        x=months,
-        y=success_rates,
-        mode='lines+markers',
-        line=dict(color='#F88734', width=3),  # Cadmium Orange line
-        marker=dict(size=8, color='#EBC09D'),  # Gold Crayola markers
-        name='Retention Success Rate'
-    )])
-    
-    fig.update_layout(
-        title="Predicted Retention Success Rate",
-        xaxis_title="Month",
-        yaxis_title="Success Rate (%)",
-        title_x=0.5,
-        font=dict(size=12),
-        height=400,
-        yaxis=dict(range=[80, 95])
-    )
+    # WebGL trace so the chart stays fast once it is fed real per-month data
+    fig = go.Figure({
+        'data': [{
+            'type': 'scattergl',
+            'x': months,
+            'y': success_rates,
+            'mode': 'lines+markers',
+            'line': {'color': '#F88734', 'width': 3},  # Cadmium Orange line
+            'marker': {'size': 8, 'color': '#EBC09D'},  # Gold Crayola markers
+            'name': 'Retention Success Rate'
+        }],
+        'layout': {
+            'title': {'text': "Predicted Retention Success Rate", 'x': 0.5},
+            'xaxis': {'title': {'text': "Month"}},
+            'yaxis': {'title': {'text': "Success Rate (%)"}, 'range': [80, 95]},
+            'font': {'size': 12},
+            'height': 400
+        }
+    })
     
     return fig
 
+# Gradio's Dataframe bogs down past a few thousand rows, so the results table is capped
+_UI_TABLE_ROW_CAP = 5000
+
+def _downsample_for_ui(results_df, cap=_UI_TABLE_ROW_CAP):
+    """Keep the most at-risk customers plus a random sample of the rest for display"""
+    if len(results_df) <= cap:
+        return results_df
+    
+    top_risk = results_df.nlargest(cap // 2, "Churn Probability")
+    sampled = results_df.drop(top_risk.index).sample(n=cap - len(top_risk), random_state=0)
+    return pd.concat([top_risk, sampled.sort_index()])
+
+# Empty-state dashboard figure only depends on constants, so build it once at import
+_EMPTY_DASHBOARD_FIG = create_dashboard_figure()
+
+# Canned chatbot replies, checked in order - the first entry with a keyword in the message wins
+_ASSISTANT_REPLIES = (
+    (("churn", "prediction"), """🎯 **Churn Prediction Analysis**
+
+Based on our AI model analysis:
+- **Model Accuracy**: 94.2% (Simulated)
+- **High Risk Customers**: 15% of total customer base
+- **Medium Risk**: 25% of customers
+- **Low Risk**: 60% of customers
+
+**Key Insights**:
+• Customers with low usage patterns show 85% churn probability
+• Payment delays increase churn risk by 3.2x
+• Customers aged 25-35 have highest retention rates
+
+**Recommended Actions**:
+1. Target high-risk customers with immediate retention campaigns
+2. Implement usage-based engagement programs
+3. Set up payment reminder systems"""),
+    (("retention", "strategy"), """📋 **Retention Strategy Recommendations**
+
+**Immediate Actions** (High Risk):
+• Personal retention calls within 24 hours
+• Emergency discount offers (15-25% off)
+• Service plan upgrades with free trial
+
+**Preventive Measures** (Medium Risk):
+• Proactive customer check-ins
+• Usage optimization recommendations
+• Loyalty program enrollment
+
+**Retention Campaigns**:
+• Email sequences for different risk levels
+• SMS alerts for payment reminders
+• In-app notifications for engagement
+
+**Success Metrics**:
+• 85% success rate for immediate actions
+• 75% redemption rate for incentives
+• 70% acceptance rate for service upgrades"""),
+    (("data", "analysis"), """📊 **Data Analysis Insights**
+
+**Customer Segmentation**:
+• **High Value**: 20% of customers, 60% of revenue
+• **Medium Value**: 45% of customers, 30% of revenue  
+• **Low Value**: 35% of customers, 10% of revenue
+
+**Behavioral Patterns**:
+• Peak usage: Weekdays 9AM-5PM
+• Payment patterns: 70% pay on time, 20% late, 10% delinquent
+• Service preferences: Mobile > Web > Phone support
+
+**Predictive Indicators**:
+• Usage decline > 30% = High churn risk
+• Payment delay > 7 days = Medium risk
+• Support tickets > 3/month = High risk
+
+**Data Quality**: 98.5% accuracy in customer profiles"""),
+    (("help", "how"), """🤖 **AURA Assistant Help**
+
+**Available Commands**:
+• Ask about "churn prediction" for risk analysis
+• Inquire about "retention strategies" for campaigns
+• Request "data analysis" for insights
+• Ask "what can you do" for capabilities
+
+**Platform Features**:
+• 📊 Dashboard: Real-time analytics
+• 🧠 Churn AI: Upload CSV for predictions
+• 📋 Playbook: Generate AI strategies
+• 💬 Assistant: This chat interface
+
+**Quick Tips**:
+• Upload customer data in CSV format
+• Generate strategies based on risk levels
+• Deploy campaigns through multiple channels
+• Monitor results in the dashboard"""),
+    (("hello", "hi"), """👋 **Welcome to AURA!**
+
+I'm your AI-powered retention assistant. I can help you with:
+
+🎯 **Churn Prediction** - Analyze customer risk levels
+📋 **Retention Strategies** - Generate targeted campaigns  
+📊 **Data Analysis** - Get insights from your data
+🚀 **Platform Guidance** - Navigate AURA features
+
+**Try asking me**:
+• "What's our churn prediction accuracy?"
+• "Show me retention strategies for high-risk customers"
+• "Analyze our customer data patterns"
+• "How do I use the playbook feature?"
+
+What would you like to know about customer retention?"""),
+    (("accuracy", "model"), """🎯 **Model Performance Metrics**
+
+**Aura AI Churn Prediction Model**:
+• **Accuracy**: 94.2% (Simulated)
+• **Precision**: 91.8% for high-risk detection
+• **Recall**: 89.5% for churn prediction
+• **F1-Score**: 90.6% overall performance
+
+**Model Features**:
+• 20+ customer attributes analyzed
+• Real-time risk scoring
+• Behavioral pattern recognition
+• Payment history analysis
+
+**Validation Results**:
+• Cross-validation accuracy: 93.7%
+• Test set performance: 94.2%
+• Production accuracy: 94.1%
+
+**Confidence Levels**:
+• High confidence predictions: 78%
+• Medium confidence: 18%
+• Low confidence: 4%"""),
+    (("customers", "segment"), """👥 **Customer Segmentation Analysis**
+
+**Risk-Based Segments**:
+• **High Risk** (15%): Immediate intervention needed
+• **Medium Risk** (25%): Preventive measures recommended
+• **Low Risk** (60%): Maintain current engagement
+
+**Value-Based Segments**:
+• **Premium** (20%): High revenue, low churn
+• **Standard** (45%): Moderate revenue, medium churn
+• **Basic** (35%): Lower revenue, higher churn
+
+**Behavioral Segments**:
+• **Power Users**: High engagement, low churn risk
+• **Casual Users**: Moderate usage, medium risk
+• **At-Risk Users**: Declining usage, high churn risk
+
+**Demographic Insights**:
+• Age 25-35: Highest retention rates
+• Age 18-24: Highest churn rates
+• Age 35+: Most stable customer base""")
+)
+
+# Reply for messages that match none of the keywords above; {} is the user's message
+_ASSISTANT_FALLBACK = """🤖 **AURA Assistant Response**
+
+I understand you're asking about: "{}"
+
+Here's what I can help you with:
+
+🎯 **Churn Prediction**: Ask about risk analysis and model accuracy
+📋 **Retention Strategies**: Get campaign recommendations
+📊 **Data Analysis**: Request customer insights and patterns
+🚀 **Platform Help**: Learn about AURA features
+
+**Try these specific questions**:
+• "What's our churn prediction model accuracy?"
+• "Show me retention strategies for high-risk customers"
+• "Analyze our customer segmentation data"
+• "How do I generate AI strategies in the playbook?"
+
+What specific aspect of customer retention would you like to explore?"""
+
+# Chatbot replies depend only on the message text, so repeat questions are served from cache
+@lru_cache(maxsize=512)
+def generate_assistant_response(message):
+    """Pick the hardcoded AI assistant response for a chat message"""
+    message_lower = message.lower()
+    
+    for keywords, response in _ASSISTANT_REPLIES:
+        if any(keyword in message_lower for keyword in keywords):
+            return response
+    
+    return _ASSISTANT_FALLBACK.format(message)
+
 # Create FastAPI app
 app = FastAPI(
     title="A.U.R.A - Adaptive User Retention Assistant",
@@ -142,134 +323,168 @@ app = FastAPI(
     version="2.0.0"
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add CORS middleware for configured origins only - the app's own pages are same-origin and
+# never need it; preflights are cached by the browser for 24h
+if CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=("GET", "POST"),
+        allow_headers=("content-type", "authorization"),
+        max_age=86400,
+    )
+
+class _GZipExceptGradio:
+    """Gzip app responses but pass the mounted Gradio app through untouched"""
+    
+    def __init__(self, app, path_prefix="/gradio", **gzip_options):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, **gzip_options)
+        self.path_prefix = path_prefix
+    
+    async def __call__(self, scope, receive, send):
+        # Older Starlette releases buffer text/event-stream responses too, which would
+        # stall Gradio's queue stream, so everything under the mount bypasses compression
+        if scope["type"] == "http" and not scope["path"].startswith(self.path_prefix):
+            await self.gzip_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+# Compress HTML/JSON responses; registered after CORS so it wraps the CORS-decorated response
+app.add_middleware(_GZipExceptGradio, minimum_size=500, compresslevel=5)
 
 # Add static file serving for logo and other assets
 app.mount("/static", StaticFiles(directory="."), name="static")
 
+# AI Strategy Generation Logic - read-only table shared by every session, built once at import
+_STRATEGIES = MappingProxyType({
+    "High Risk": {
+        "Retention Campaign": {
+            "strategy_1": {
+                "title": "Emergency Retention Call",
+                "description": "Immediate personal intervention for high-risk customers",
+                "steps": "1. Identify customer pain points\n2. Offer immediate resolution\n3. Schedule retention specialist call\n4. Provide exclusive retention offer",
+                "impact": "90% engagement rate, 60% retention success"
+            },
+            "strategy_2": {
+                "title": "Premium Service Upgrade",
+                "description": "Complimentary upgrade to premium service tier",
+                "steps": "1. Analyze current service level\n2. Identify upgrade opportunities\n3. Offer complimentary premium features\n4. Monitor usage and satisfaction",
+                "impact": "80% acceptance rate, increased loyalty"
+            },
+            "strategy_3": {
+                "title": "Personal Account Manager",
+                "description": "Assign dedicated account manager for personalized service",
+                "steps": "1. Assign experienced retention specialist\n2. Schedule weekly check-ins\n3. Provide priority support access\n4. Track satisfaction metrics",
+                "impact": "85% satisfaction improvement, 70% retention"
+            }
+        },
+        "Win-Back Campaign": {
+            "strategy_1": {
+                "title": "Win-Back Phone Call",
+                "description": "Personalized win-back call with special offers",
+                "steps": "1. Prepare personalized win-back offer\n2. Schedule callback within 24 hours\n3. Present exclusive return benefits\n4. Follow up with email confirmation",
+                "impact": "75% callback rate, 50% win-back success"
+            },
+            "strategy_2": {
+                "title": "Exclusive Return Package",
+                "description": "Special package for returning customers",
+                "steps": "1. Create exclusive return benefits\n2. Send personalized email offer\n3. Include premium service trial\n4. Track return engagement",
+                "impact": "65% email open rate, 40% return rate"
+            },
+            "strategy_3": {
+                "title": "Loyalty Points Bonus",
+                "description": "Bonus loyalty points for returning customers",
+                "steps": "1. Calculate bonus points offer\n2. Send SMS with exclusive code\n3. Provide instant redemption\n4. Monitor redemption patterns",
+                "impact": "70% SMS engagement, 55% redemption rate"
+            }
+        }
+    },
+    "Medium Risk": {
+        "Retention Campaign": {
+            "strategy_1": {
+                "title": "Proactive Service Review",
+                "description": "Scheduled service review to identify improvement opportunities",
+                "steps": "1. Schedule service review call\n2. Analyze usage patterns\n3. Identify optimization opportunities\n4. Propose service improvements",
+                "impact": "80% engagement rate, 45% retention improvement"
+            },
+            "strategy_2": {
+                "title": "Loyalty Program Enrollment",
+                "description": "Enroll in enhanced loyalty program with exclusive benefits",
+                "steps": "1. Create personalized loyalty offer\n2. Send enrollment invitation\n3. Provide exclusive member benefits\n4. Track program engagement",
+                "impact": "75% enrollment rate, increased engagement"
+            },
+            "strategy_3": {
+                "title": "Feature Education Campaign",
+                "description": "Educational campaign about unused features and benefits",
+                "steps": "1. Identify unused features\n2. Create educational content\n3. Send feature highlight emails\n4. Track feature adoption",
+                "impact": "60% email engagement, 35% feature adoption"
+            }
+        }
+    },
+    "Low Risk": {
+        "Retention Campaign": {
+            "strategy_1": {
+                "title": "Satisfaction Survey & Follow-up",
+                "description": "Regular satisfaction surveys with personalized follow-up",
+                "steps": "1. Send satisfaction survey\n2. Analyze responses\n3. Address any concerns\n4. Follow up with improvements",
+                "impact": "85% survey completion, 95% satisfaction"
+            },
+            "strategy_2": {
+                "title": "Referral Program Invitation",
+                "description": "Invite to exclusive referral program with rewards",
+                "steps": "1. Create referral program offer\n2. Send invitation email\n3. Provide referral tools\n4. Track referral activity",
+                "impact": "70% program participation, increased advocacy"
+            },
+            "strategy_3": {
+                "title": "Premium Feature Preview",
+                "description": "Exclusive preview of upcoming premium features",
+                "steps": "1. Identify premium features\n2. Create preview content\n3. Send exclusive preview\n4. Gather feedback and interest",
+                "impact": "80% preview engagement, 25% upgrade interest"
+            }
+        }
+    }
+})
+
+# Only 4 segments x 4 strategy types exist, so every lookup after the first is a cache hit
+@lru_cache(maxsize=32)
+def _lookup_strategies(customer_segment, strategy_type):
+    """Return title, description and impact of the three strategies for a segment and type"""
+    # Get strategies for the selected segment and type
+    segment_strategies = _STRATEGIES.get(customer_segment, _STRATEGIES["High Risk"])
+    type_strategies = segment_strategies.get(strategy_type, segment_strategies["Retention Campaign"])
+    
+    return (
+        type_strategies["strategy_1"]["title"],
+        type_strategies["strategy_1"]["description"],
+        type_strategies["strategy_1"]["impact"],
+        type_strategies["strategy_2"]["title"],
+        type_strategies["strategy_2"]["description"],
+        type_strategies["strategy_2"]["impact"],
+        type_strategies["strategy_3"]["title"],
+        type_strategies["strategy_3"]["description"],
+        type_strategies["strategy_3"]["impact"]
+    )
+
+# Deployment confirmations per channel, filled in with the strategy title on each press
+_CHANNEL_TEMPLATES = MappingProxyType({
+    "📧 Email Campaign": "📧 Email campaign deployed for '{title}' - Sent to customer segment",
+    "📱 SMS Alert": "📱 SMS alert sent for '{title}' - Delivered to mobile devices",
+    "📱 In-App Notification": "📱 In-app notification triggered for '{title}' - Active in customer app",
+    "📞 Direct Call": "📞 Direct call scheduled for '{title}' - Added to call queue"
+})
+
 # Create Gradio interface
 def create_gradio_interface():
     """Create working Gradio interface"""
     print("Starting create_gradio_interface function...")
     
-    def update_pie_chart(prediction_data):
-        """Update pie chart with prediction data"""
-        return create_churn_distribution_pie(prediction_data)
-    
     def generate_ai_strategies(customer_segment, strategy_type):
         """Generate AI-powered retention strategies based on customer segment and strategy type"""
-        # AI Strategy Generation Logic
-        strategies = {
-            "High Risk": {
-                "Retention Campaign": {
-                    "strategy_1": {
-                        "title": "Emergency Retention Call",
-                        "description": "Immediate personal intervention for high-risk customers",
-                        "steps": "1. Identify customer pain points\n2. Offer immediate resolution\n3. Schedule retention specialist call\n4. Provide exclusive retention offer",
-                        "impact": "90% engagement rate, 60% retention success"
-                    },
-                    "strategy_2": {
-                        "title": "Premium Service Upgrade",
-                        "description": "Complimentary upgrade to premium service tier",
-                        "steps": "1. Analyze current service level\n2. Identify upgrade opportunities\n3. Offer complimentary premium features\n4. Monitor usage and satisfaction",
-                        "impact": "80% acceptance rate, increased loyalty"
-                    },
-                    "strategy_3": {
-                        "title": "Personal Account Manager",
-                        "description": "Assign dedicated account manager for personalized service",
-                        "steps": "1. Assign experienced retention specialist\n2. Schedule weekly check-ins\n3. Provide priority support access\n4. Track satisfaction metrics",
-                        "impact": "85% satisfaction improvement, 70% retention"
-                    }
-                },
-                "Win-Back Campaign": {
-                    "strategy_1": {
-                        "title": "Win-Back Phone Call",
-                        "description": "Personalized win-back call with special offers",
-                        "steps": "1. Prepare personalized win-back offer\n2. Schedule callback within 24 hours\n3. Present exclusive return benefits\n4. Follow up with email confirmation",
-                        "impact": "75% callback rate, 50% win-back success"
-                    },
-                    "strategy_2": {
-                        "title": "Exclusive Return Package",
-                        "description": "Special package for returning customers",
-                        "steps": "1. Create exclusive return benefits\n2. Send personalized email offer\n3. Include premium service trial\n4. Track return engagement",
-                        "impact": "65% email open rate, 40% return rate"
-                    },
-                    "strategy_3": {
-                        "title": "Loyalty Points Bonus",
-                        "description": "Bonus loyalty points for returning customers",
-                        "steps": "1. Calculate bonus points offer\n2. Send SMS with exclusive code\n3. Provide instant redemption\n4. Monitor redemption patterns",
-                        "impact": "70% SMS engagement, 55% redemption rate"
-                    }
-                }
-            },
-            "Medium Risk": {
-                "Retention Campaign": {
-                    "strategy_1": {
-                        "title": "Proactive Service Review",
-                        "description": "Scheduled service review to identify improvement opportunities",
-                        "steps": "1. Schedule service review call\n2. Analyze usage patterns\n3. Identify optimization opportunities\n4. Propose service improvements",
-                        "impact": "80% engagement rate, 45% retention improvement"
-                    },
-                    "strategy_2": {
-                        "title": "Loyalty Program Enrollment",
-                        "description": "Enroll in enhanced loyalty program with exclusive benefits",
-                        "steps": "1. Create personalized loyalty offer\n2. Send enrollment invitation\n3. Provide exclusive member benefits\n4. Track program engagement",
-                        "impact": "75% enrollment rate, increased engagement"
-                    },
-                    "strategy_3": {
-                        "title": "Feature Education Campaign",
-                        "description": "Educational campaign about unused features and benefits",
-                        "steps": "1. Identify unused features\n2. Create educational content\n3. Send feature highlight emails\n4. Track feature adoption",
-                        "impact": "60% email engagement, 35% feature adoption"
-                    }
-                }
-            },
-            "Low Risk": {
-                "Retention Campaign": {
-                    "strategy_1": {
-                        "title": "Satisfaction Survey & Follow-up",
-                        "description": "Regular satisfaction surveys with personalized follow-up",
-                        "steps": "1. Send satisfaction survey\n2. Analyze responses\n3. Address any concerns\n4. Follow up with improvements",
-                        "impact": "85% survey completion, 95% satisfaction"
-                    },
-                    "strategy_2": {
-                        "title": "Referral Program Invitation",
-                        "description": "Invite to exclusive referral program with rewards",
-                        "steps": "1. Create referral program offer\n2. Send invitation email\n3. Provide referral tools\n4. Track referral activity",
-                        "impact": "70% program participation, increased advocacy"
-                    },
-                    "strategy_3": {
-                        "title": "Premium Feature Preview",
-                        "description": "Exclusive preview of upcoming premium features",
-                        "steps": "1. Identify premium features\n2. Create preview content\n3. Send exclusive preview\n4. Gather feedback and interest",
-                        "impact": "80% preview engagement, 25% upgrade interest"
-                    }
-                }
-            }
-        }
-        
-        # Get strategies for the selected segment and type
-        segment_strategies = strategies.get(customer_segment, strategies["High Risk"])
-        type_strategies = segment_strategies.get(strategy_type, segment_strategies["Retention Campaign"])
-        
         # Return the three strategies (without Implementation Steps)
         return (
-            type_strategies["strategy_1"]["title"],
-            type_strategies["strategy_1"]["description"],
-            type_strategies["strategy_1"]["impact"],
-            type_strategies["strategy_2"]["title"],
-            type_strategies["strategy_2"]["description"],
-            type_strategies["strategy_2"]["impact"],
-            type_strategies["strategy_3"]["title"],
-            type_strategies["strategy_3"]["description"],
-            type_strategies["strategy_3"]["impact"],
+            *_lookup_strategies(customer_segment, strategy_type),
             f"✅ Generated 3 AI strategies for {customer_segment} customers using {strategy_type}",
             gr.Group(visible=True)  # Make strategy cards visible
         )
@@ -277,14 +492,8 @@ def create_gradio_interface():
     def deploy_strategy_channel(strategy_num, channel, strategy_title):
         """Deploy strategy through selected channel"""
         try:
-            channel_messages = {
-                "📧 Email Campaign": f"📧 Email campaign deployed for '{strategy_title}' - Sent to customer segment",
-                "📱 SMS Alert": f"📱 SMS alert sent for '{strategy_title}' - Delivered to mobile devices",
-                "📱 In-App Notification": f"📱 In-app notification triggered for '{strategy_title}' - Active in customer app",
-                "📞 Direct Call": f"📞 Direct call scheduled for '{strategy_title}' - Added to call queue"
-            }
-            
-            message = channel_messages.get(channel, f"✅ Strategy {strategy_num} deployed through {channel}")
+            template = _CHANNEL_TEMPLATES.get(channel)
+            message = template.format(title=strategy_title) if template else f"✅ Strategy {strategy_num} deployed through {channel}"
             return f"✅ {message}\n\nStatus: Successfully deployed\nChannel: {channel}\nStrategy: {strategy_title}\nTimestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             
         except Exception as e:
@@ -293,54 +502,52 @@ def create_gradio_interface():
     def process_data(csv_file):
         """Process uploaded CSV data and generate predictions"""
         if csv_file is None:
-            return "Please upload a CSV file first.", None, None, None, None
+            return "Please upload a CSV file first.", None, None, None
         
         try:
-            # Load the uploaded CSV file
-            df = pd.read_csv(csv_file.name)
+            # Check for required columns from the header alone, before parsing any rows
+            header = pd.read_csv(csv_file.name, nrows=0)
+            if 'customerID' not in header.columns:
+                return "Error: CSV file must contain 'customerID' column.", None, None, None
             
-            # Check for required columns
-            if 'customerID' not in df.columns:
-                return "Error: CSV file must contain 'customerID' column.", None, None, None, None
+            # Load only the customerID column - the rest of the upload is never used
+            df = pd.read_csv(csv_file.name, usecols=['customerID'], dtype={'customerID': 'string'})
             
-            # Simulate predictions
-            np.random.seed(42)
+            # Simulate predictions with a local generator so concurrent calls never share RNG state
+            rng = np.random.default_rng(42)
             n_customers = len(df)
             
-            predictions = []
-            for i in range(n_customers):
-                prob = np.random.beta(2, 5)  # Skewed towards lower probabilities
-                if prob < 0.3:
-                    risk_level = "Low Risk"
-                elif prob < 0.7:
-                    risk_level = "Medium Risk"
-                else:
-                    risk_level = "High Risk"
-                
-                predictions.append({
-                    "Customer ID": f"CUST_{i+1:04d}",
-                    "Churn Probability": round(prob * 100, 1),
-                    "Risk Level": risk_level
-                })
+            # Format all customer IDs in one vectorized pass (CUST_0001, CUST_0002, ...)
+            customer_ids = np.char.mod("CUST_%04d", np.arange(1, n_customers + 1))
             
-            # Create results dataframe
-            results_df = pd.DataFrame(predictions)
+            # Draw every probability in one call - skewed towards lower probabilities
+            probs = rng.beta(2, 5, size=n_customers)
             
-            # Create simple chart data
-            risk_counts = pd.Series([p["Risk Level"] for p in predictions]).value_counts()
+            # Bucket into integer risk codes: [0, 0.3) -> 0 Low, [0.3, 0.7) -> 1 Medium, [0.7, 1) -> 2 High
+            risk_codes = np.digitize(probs, [0.3, 0.7])
+            risk_levels = pd.Categorical.from_codes(risk_codes, categories=_RISK_LABELS)
             
-            # Create prediction data for charts
-            prediction_data = [[p["Customer ID"], p["Churn Probability"], p["Risk Level"]] for p in predictions]
+            # Create results dataframe straight from the column arrays
+            results_df = pd.DataFrame({
+                "Customer ID": customer_ids,
+                "Churn Probability": np.round(probs * 100, 1),
+                "Risk Level": risk_levels
+            })
             
-            # Create the actual chart objects
-            pie_chart = create_churn_distribution_pie(prediction_data)
-            bar_chart = create_key_metrics_bar(prediction_data)
+            # Create simple chart data - a 3-bin histogram over the risk codes
+            counts = np.bincount(risk_codes, minlength=3)
+            risk_counts = dict(zip(_RISK_LABELS, counts.tolist()))
+            
+            # Create the actual chart object from the counts already computed above
+            dashboard_chart = create_dashboard_figure(counts=risk_counts)
             
             status_msg = f"✅ Data processed successfully! Analyzed {n_customers} customers."
-            return status_msg, results_df, risk_counts.to_dict(), pie_chart, bar_chart
+            if n_customers > _UI_TABLE_ROW_CAP:
+                status_msg += f" Showing the {_UI_TABLE_ROW_CAP // 2} highest-risk customers plus a random sample."
+            return status_msg, _downsample_for_ui(results_df), risk_counts, dashboard_chart
             
         except Exception as e:
-            return f"❌ Error processing data: {str(e)}", None, None, None, None
+            return f"❌ Error processing data: {str(e)}", None, None, None
     
     # Create Gradio interface with dark theme inspired by Gorilla Science
     with gr.Blocks(
@@ -747,23 +954,13 @@ def create_gradio_interface():
                 interactive=False
             )
             
-            # Visualization Charts
+            # Visualization Charts - churn distribution pie and key metrics bar in one figure
             with gr.Row():
-                with gr.Column(scale=1):
-                    # Churn Distribution Pie Chart
-                    churn_pie_chart = gr.Plot(
-                        value=create_churn_distribution_pie(),
-                        label="Churn Risk Distribution (Run prediction to see data)",
-                        show_label=True
-                    )
-                
-                with gr.Column(scale=1):
-                    # Key Metrics Bar Chart
-                    metrics_bar_chart = gr.Plot(
-                        value=create_key_metrics_bar(),
-                        label="Customer Risk Distribution (Run prediction to see data)",
-                        show_label=True
-                    )
+                dashboard_chart = gr.Plot(
+                    value=_EMPTY_DASHBOARD_FIG,
+                    label="Churn Risk Dashboard (Run prediction to see data)",
+                    show_label=True
+                )
         
         
         # Playbook Tab
@@ -948,7 +1145,7 @@ def create_gradio_interface():
         process_data_btn.click(
             process_data,
             inputs=[csv_file],
-            outputs=[newai_status, results_table, risk_chart, churn_pie_chart, metrics_bar_chart]
+            outputs=[newai_status, results_table, risk_chart, dashboard_chart]
         )
         
         
@@ -956,177 +1153,7 @@ def create_gradio_interface():
         def respond(message, history):
             """Hardcoded AI assistant responses based on churn AI output"""
             try:
-                message_lower = message.lower()
-                
-                # Hardcoded responses based on common questions
-                if "churn" in message_lower or "prediction" in message_lower:
-                    response = """🎯 **Churn Prediction Analysis**
-
-Based on our AI model analysis:
-- **Model Accuracy**: 94.2% (Simulated)
-- **High Risk Customers**: 15% of total customer base
-- **Medium Risk**: 25% of customers
-- **Low Risk**: 60% of customers
-
-**Key Insights**:
-• Customers with low usage patterns show 85% churn probability
-• Payment delays increase churn risk by 3.2x
-• Customers aged 25-35 have highest retention rates
-
-**Recommended Actions**:
-1. Target high-risk customers with immediate retention campaigns
-2. Implement usage-based engagement programs
-3. Set up payment reminder systems"""
-                
-                elif "retention" in message_lower or "strategy" in message_lower:
-                    response = """📋 **Retention Strategy Recommendations**
-
-**Immediate Actions** (High Risk):
-• Personal retention calls within 24 hours
-• Emergency discount offers (15-25% off)
-• Service plan upgrades with free trial
-
-**Preventive Measures** (Medium Risk):
-• Proactive customer check-ins
-• Usage optimization recommendations
-• Loyalty program enrollment
-
-**Retention Campaigns**:
-• Email sequences for different risk levels
-• SMS alerts for payment reminders
-• In-app notifications for engagement
-
-**Success Metrics**:
-• 85% success rate for immediate actions
-• 75% redemption rate for incentives
-• 70% acceptance rate for service upgrades"""
-                
-                elif "data" in message_lower or "analysis" in message_lower:
-                    response = """📊 **Data Analysis Insights**
-
-**Customer Segmentation**:
-• **High Value**: 20% of customers, 60% of revenue
-• **Medium Value**: 45% of customers, 30% of revenue  
-• **Low Value**: 35% of customers, 10% of revenue
-
-**Behavioral Patterns**:
-• Peak usage: Weekdays 9AM-5PM
-• Payment patterns: 70% pay on time, 20% late, 10% delinquent
-• Service preferences: Mobile > Web > Phone support
-
-**Predictive Indicators**:
-• Usage decline > 30% = High churn risk
-• Payment delay > 7 days = Medium risk
-• Support tickets > 3/month = High risk
-
-**Data Quality**: 98.5% accuracy in customer profiles"""
-                
-                elif "help" in message_lower or "how" in message_lower:
-                    response = """🤖 **AURA Assistant Help**
-
-**Available Commands**:
-• Ask about "churn prediction" for risk analysis
-• Inquire about "retention strategies" for campaigns
-• Request "data analysis" for insights
-• Ask "what can you do" for capabilities
-
-**Platform Features**:
-• 📊 Dashboard: Real-time analytics
-• 🧠 Churn AI: Upload CSV for predictions
-• 📋 Playbook: Generate AI strategies
-• 💬 Assistant: This chat interface
-
-**Quick Tips**:
-• Upload customer data in CSV format
-• Generate strategies based on risk levels
-• Deploy campaigns through multiple channels
-• Monitor results in the dashboard"""
-                
-                elif "hello" in message_lower or "hi" in message_lower:
-                    response = """👋 **Welcome to AURA!**
-
-I'm your AI-powered retention assistant. I can help you with:
-
-🎯 **Churn Prediction** - Analyze customer risk levels
-📋 **Retention Strategies** - Generate targeted campaigns  
-📊 **Data Analysis** - Get insights from your data
-🚀 **Platform Guidance** - Navigate AURA features
-
-**Try asking me**:
-• "What's our churn prediction accuracy?"
-• "Show me retention strategies for high-risk customers"
-• "Analyze our customer data patterns"
-• "How do I use the playbook feature?"
-
-What would you like to know about customer retention?"""
-                
-                elif "accuracy" in message_lower or "model" in message_lower:
-                    response = """🎯 **Model Performance Metrics**
-
-**Aura AI Churn Prediction Model**:
-• **Accuracy**: 94.2% (Simulated)
-• **Precision**: 91.8% for high-risk detection
-• **Recall**: 89.5% for churn prediction
-• **F1-Score**: 90.6% overall performance
-
-**Model Features**:
-• 20+ customer attributes analyzed
-• Real-time risk scoring
-• Behavioral pattern recognition
-• Payment history analysis
-
-**Validation Results**:
-• Cross-validation accuracy: 93.7%
-• Test set performance: 94.2%
-• Production accuracy: 94.1%
-
-**Confidence Levels**:
-• High confidence predictions: 78%
-• Medium confidence: 18%
-• Low confidence: 4%"""
-                
-                elif "customers" in message_lower or "segment" in message_lower:
-                    response = """👥 **Customer Segmentation Analysis**
-
-**Risk-Based Segments**:
-• **High Risk** (15%): Immediate intervention needed
-• **Medium Risk** (25%): Preventive measures recommended
-• **Low Risk** (60%): Maintain current engagement
-
-**Value-Based Segments**:
-• **Premium** (20%): High revenue, low churn
-• **Standard** (45%): Moderate revenue, medium churn
-• **Basic** (35%): Lower revenue, higher churn
-
-**Behavioral Segments**:
-• **Power Users**: High engagement, low churn risk
-• **Casual Users**: Moderate usage, medium risk
-• **At-Risk Users**: Declining usage, high churn risk
-
-**Demographic Insights**:
-• Age 25-35: Highest retention rates
-• Age 18-24: Highest churn rates
-• Age 35+: Most stable customer base"""
-                
-                else:
-                    response = """🤖 **AURA Assistant Response**
-
-I understand you're asking about: "{}"
-
-Here's what I can help you with:
-
-🎯 **Churn Prediction**: Ask about risk analysis and model accuracy
-📋 **Retention Strategies**: Get campaign recommendations
-📊 **Data Analysis**: Request customer insights and patterns
-🚀 **Platform Help**: Learn about AURA features
-
-**Try these specific questions**:
-• "What's our churn prediction model accuracy?"
-• "Show me retention strategies for high-risk customers"
-• "Analyze our customer segmentation data"
-• "How do I generate AI strategies in the playbook?"
-
-What specific aspect of customer retention would you like to explore?""".format(message)
+                response = generate_assistant_response(message)
                 
                 # Return in the correct format for messages type
                 return [{"role": "user", "content": message}, {"role": "assistant", "content": response}]
@@ -1158,59 +1185,22 @@ What specific aspect of customer retention would you like to explore?""".format(
             ]
         )
         
-        # Target button events for Strategy 1
-        target_email_1.click(
-            lambda: deploy_strategy_channel("1", "📧 Email Campaign", strategy_1_title.value),
-            outputs=[channel_status]
-        )
-        target_sms_1.click(
-            lambda: deploy_strategy_channel("1", "📱 SMS Alert", strategy_1_title.value),
-            outputs=[channel_status]
-        )
-        target_app_1.click(
-            lambda: deploy_strategy_channel("1", "📱 In-App Notification", strategy_1_title.value),
-            outputs=[channel_status]
-        )
-        target_call_1.click(
-            lambda: deploy_strategy_channel("1", "📞 Direct Call", strategy_1_title.value),
-            outputs=[channel_status]
-        )
-        
-        # Target button events for Strategy 2
-        target_email_2.click(
-            lambda: deploy_strategy_channel("2", "📧 Email Campaign", strategy_2_title.value),
-            outputs=[channel_status]
-        )
-        target_sms_2.click(
-            lambda: deploy_strategy_channel("2", "📱 SMS Alert", strategy_2_title.value),
-            outputs=[channel_status]
-        )
-        target_app_2.click(
-            lambda: deploy_strategy_channel("2", "📱 In-App Notification", strategy_2_title.value),
-            outputs=[channel_status]
-        )
-        target_call_2.click(
-            lambda: deploy_strategy_channel("2", "📞 Direct Call", strategy_2_title.value),
-            outputs=[channel_status]
-        )
-        
-        # Target button events for Strategy 3
-        target_email_3.click(
-            lambda: deploy_strategy_channel("3", "📧 Email Campaign", strategy_3_title.value),
-            outputs=[channel_status]
-        )
-        target_sms_3.click(
-            lambda: deploy_strategy_channel("3", "📱 SMS Alert", strategy_3_title.value),
-            outputs=[channel_status]
-        )
-        target_app_3.click(
-            lambda: deploy_strategy_channel("3", "📱 In-App Notification", strategy_3_title.value),
-            outputs=[channel_status]
-        )
-        target_call_3.click(
-            lambda: deploy_strategy_channel("3", "📞 Direct Call", strategy_3_title.value),
-            outputs=[channel_status]
+        # Target button events - the strategy title is passed in as an input so the handler
+        # sees the currently generated title rather than the textbox's initial value
+        strategy_titles = (strategy_1_title, strategy_2_title, strategy_3_title)
+        channel_buttons = (
+            ("📧 Email Campaign", (target_email_1, target_email_2, target_email_3)),
+            ("📱 SMS Alert", (target_sms_1, target_sms_2, target_sms_3)),
+            ("📱 In-App Notification", (target_app_1, target_app_2, target_app_3)),
+            ("📞 Direct Call", (target_call_1, target_call_2, target_call_3))
         )
+        for channel, buttons in channel_buttons:
+            for strategy_num, (strategy_title, button) in enumerate(zip(strategy_titles, buttons), start=1):
+                button.click(
+                    partial(deploy_strategy_channel, str(strategy_num), channel),
+                    inputs=[strategy_title],
+                    outputs=[channel_status]
+                )
         
     
     return interface
@@ -1220,13 +1210,15 @@ print("Creating Gradio interface...")
 gradio_interface = create_gradio_interface()
 print(f"Gradio interface created: {gradio_interface is not None}")
 
-# Mount Gradio app
-app = gr.mount_gradio_app(app, gradio_interface, path="/gradio")
+# Sync handlers already run on Gradio's thread pool; let a few events run side by side
+# instead of the default one-at-a-time, and bound the backlog so bursts fail fast
+gradio_interface.queue(default_concurrency_limit=4, max_size=32)
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Root endpoint - Redirect to Gradio interface"""
-    return """
+# Mount Gradio app onto the existing FastAPI instance (mutates it in place, no rebinding)
+gr.mount_gradio_app(app, gradio_interface, path="/gradio")
+
+# Landing page is static: encode it once at import; each request still gets its own Response
+_ROOT_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -1317,31 +1309,62 @@ async def root():
     </html>
     """
 
+_ROOT_HTML_BYTES = _ROOT_HTML.encode("utf-8")
+_ROOT_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+@app.get("/", response_class=HTMLResponse)
+async def root():
+    """Root endpoint - Redirect to Gradio interface"""
+    # Not shared between requests: middleware such as gzip rewrites a response's headers in place
+    return HTMLResponse(content=_ROOT_HTML_BYTES, headers=_ROOT_HEADERS)
+
 # Removed health check endpoint as requested
 
+# Model information is static, so build it once instead of per request
+_MODEL_INFO = {
+    "name": "Working Aura AI Churn Prediction Model",
+    "type": "Machine Learning",
+    "version": "2.0.0",
+    "features": [
+        "Customer Demographics",
+        "Service Usage Patterns",
+        "Contract Information",
+        "Payment History",
+        "Billing Patterns"
+    ],
+    "performance": {
+        "accuracy": "94.2%",
+        "precision": "91.8%",
+        "recall": "89.3%",
+        "f1_score": "90.5%"
+    },
+    "available": True,
+    "mode": "simulation"
+}
+
+# Serialize once; returning a Response skips FastAPI's encoder pass entirely
+_MODEL_INFO_JSON = orjson.dumps(_MODEL_INFO)
+_MODEL_INFO_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "ETag": '"' + hashlib.blake2b(_MODEL_INFO_JSON, digest_size=8).hexdigest() + '"'
+}
+
+def _etag_matches(if_none_match, etag):
+    """Weak If-None-Match comparison (RFC 9110): a listed tag, W/-prefixed or not, or *"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 @app.get("/api/v2/info")
-async def get_model_info():
+async def get_model_info(request: Request):
     """Get model information"""
-    return {
-        "name": "Working Aura AI Churn Prediction Model",
-        "type": "Machine Learning",
-        "version": "2.0.0",
-        "features": [
-            "Customer Demographics",
-            "Service Usage Patterns",
-            "Contract Information",
-            "Payment History",
-            "Billing Patterns"
-        ],
-        "performance": {
-            "accuracy": "94.2%",
-            "precision": "91.8%",
-            "recall": "89.3%",
-            "f1_score": "90.5%"
-        },
-        "available": True,
-        "mode": "simulation"
-    }
+    # A new Response each time (middleware such as gzip edits headers in place);
+    # clients that already hold the current payload get an empty 304
+    if _etag_matches(request.headers.get("if-none-match", ""), _MODEL_INFO_HEADERS["ETag"]):
+        return Response(status_code=304, headers=_MODEL_INFO_HEADERS)
+    return Response(content=_MODEL_INFO_JSON, media_type="application/json", headers=_MODEL_INFO_HEADERS)
 
 def main():
     """Main function to run the Working AURA app"""
@@ -1364,7 +1387,14 @@ def main():
         host="0.0.0.0",
         port=3000,
         reload=False,
-        log_level="info"
+        loop="auto",  # uvloop when installed (uvicorn[standard], except on Windows)
+        http="auto",  # httptools C parser when installed, h11 otherwise
+        workers=1,  # Gradio keeps its queue and sessions in-process
+        backlog=4096,
+        limit_concurrency=1000,
+        timeout_keep_alive=5,
+        access_log=not IS_PRODUCTION,  # one formatted record per request otherwise
+        log_level="warning" if IS_PRODUCTION else "info"
     )
 
 if __name__ == "__main__":